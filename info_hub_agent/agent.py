@@ -1,12 +1,175 @@
 from typing import Optional, List, Dict
+import asyncio
+import io
+import threading
+import time
+import httpx
 import requests
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from selectolax.parser import HTMLParser
 
 from google.adk.agents import Agent
 from google.adk.tools import google_search, agent_tool
 
+# Browser-like headers shared by all fetchers, carried once on the session
+_COMMON_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    # Ask for compressed responses; urllib3/httpx decompress transparently
+    # (brotli support comes from the installed brotli package)
+    'Accept-Encoding': 'br, gzip, deflate',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# (connect, read) timeouts; a tight connect cap keeps a dead host from
+# tying up an agent worker for the OS-level TCP timeout of minutes
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Shared session so repeated tool calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake on every invocation
+_SESSION = requests.Session()
+_SESSION.headers.update(_COMMON_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            connect=2,
+            read=1,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
+# Extra headers the DepEd site expects on top of the shared defaults
+_DEPED_HEADERS = {
+    'Referer': 'https://www.deped.gov.ph/',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Prefix for turning the trending page's relative repo links into full URLs
+_GH_PREFIX = "https://github.com"
+
+# Deletes all whitespace from a repo title in one pass over the string
+_STRIP_TABLE = str.maketrans("", "", " \n\r\t")
+
+# Async client shared by the concurrent fetch path; keep-alive connections
+# are reused across calls just like the sync session above
+_ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(10, connect=3.05),
+    headers=_COMMON_HEADERS,
+    limits=httpx.Limits(max_keepalive_connections=8),
+    follow_redirects=True,
+)
+
+
+# Small TTL cache over parsed results so repeated tool calls within a
+# conversation reuse one network+parse event instead of re-downloading
+_CACHE_TTL = 300  # seconds
+_CACHE_MAXSIZE = 8
+_cache: Dict = {}
+_cache_lock = threading.Lock()
+
+# Last DepEd response kept for ETag revalidation (304 means reuse this body)
+_deped_etag: Optional[str] = None
+_deped_content: Optional[bytes] = None
+
+_DEPED_FEED_URL = "https://www.deped.gov.ph/feed/"
+
+# Final URL after following the site's redirect chain, resolved lazily once
+_deped_resolved_url: Optional[str] = None
+
+
+def _deped_feed_url() -> str:
+    """Returns the feed's final URL, resolving the redirect chain only once.
+
+    The DepEd site can bounce through HTTP->HTTPS/trailing-slash redirects;
+    caching the destination lets every later call go there directly.
+    """
+    global _deped_resolved_url
+    if _deped_resolved_url is None:
+        try:
+            _deped_resolved_url = _SESSION.head(
+                _DEPED_FEED_URL,
+                headers=_DEPED_HEADERS,
+                allow_redirects=True,
+                timeout=_REQUEST_TIMEOUT,
+            ).url
+        except requests.RequestException:
+            return _DEPED_FEED_URL
+    return _deped_resolved_url
+
+
+def _cache_get(key):
+    """Returns the cached value for key, or None if missing or expired."""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del _cache[key]
+            return None
+        return value
+
+
+def _cache_put(key, value):
+    """Stores value under key, evicting the oldest entry when full."""
+    with _cache_lock:
+        if key not in _cache and len(_cache) >= _CACHE_MAXSIZE:
+            _cache.pop(next(iter(_cache)), None)
+        _cache[key] = (time.monotonic() + _CACHE_TTL, value)
+
+
+def _parse_hackernews_posts(content: bytes) -> List[Dict]:
+    """Extracts post titles and links from the Hacker News front page HTML."""
+    tree = HTMLParser(content)
+
+    posts = []
+
+    # One CSS pass grabs every post link directly
+    for link_tag in tree.css("tr.athing span.titleline > a"):
+        posts.append({
+            "title": link_tag.text(strip=True),
+            "link": link_tag.attributes.get("href", ""),
+        })
+
+    return posts
+
+
+def _parse_github_trending_repos(content: bytes) -> List[Dict]:
+    """Extracts repo names and links from the GitHub trending page HTML."""
+    tree = HTMLParser(content)
+    repos = []
+
+    # One CSS pass grabs the repo link inside each article's h2
+    for link_tag in tree.css("article.Box-row h2.h3 a"):
+        relative_link = link_tag.attributes.get("href", "")
+        full_link = _GH_PREFIX + relative_link
+
+        # The anchor text is 'owner / repo_name' with internal whitespace;
+        # drop all of it to get "owner/repo_name"
+        title = link_tag.text(strip=True).translate(_STRIP_TABLE)
+
+        repos.append({"title": title, "link": full_link})
+
+    return repos
+
 
 def get_hackernews_posts(number_of_posts: Optional[int] = None):
     """
@@ -16,44 +179,25 @@ def get_hackernews_posts(number_of_posts: Optional[int] = None):
         number_of_posts: The number of posts to return. If None, returns all posts.
 
     Returns:
-        dict: status and result. In case of success, it contains a posts field with a
-        list of dictionaries, where each dictionary contains the 'title' and 'link' of a post.
+        dict: a 'posts' field with a list of dictionaries, where each dictionary
+        contains the 'title' and 'link' of a post. In case of error, it contains
+        'status' and 'error_message' fields instead.
     """
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5'
-        }
-        res = requests.get("https://news.ycombinator.com/", headers=headers)
-
-        soup = BeautifulSoup(res.content, "html.parser")
-
-        posts = []
-
-        # Find all table rows with class 'athing' - these contain the posts
-        post_rows = soup.find_all("tr", class_="athing")
-
-        for row in post_rows:
-            # Find the span with class 'titleline' within the row
-            title_span = row.find("span", class_="titleline")
-
-            if title_span:
-                # Find the anchor tag (<a>) within the title span
-                link_tag = title_span.find("a")
-                if link_tag and link_tag.has_attr("href"):
-                    title = link_tag.get_text(strip=True)
-                    link = link_tag["href"]
-                    posts.append({"title": title, "link": link})
+        posts = _cache_get("hackernews")
+        if posts is None:
+            res = _SESSION.get(
+                "https://news.ycombinator.com/", timeout=_REQUEST_TIMEOUT
+            )
+            res.raise_for_status()
+            posts = _parse_hackernews_posts(res.content)
+            _cache_put("hackernews", posts)
 
         if number_of_posts is not None:
             posts = posts[:number_of_posts]
 
-        return {
-            "status": "success",
-            "posts": posts,
-        }
+        return {"posts": posts}
     except Exception as e:
         return {
             "status": "error",
@@ -69,59 +213,25 @@ def get_github_trending_repos(number_of_repos: Optional[int] = None):
         number_of_repos: The number of repos from the trending page to return. If None, returns all repos.
 
     Returns:
-        dict: status and result. In case of success, it contains a repos field with a
-        list of dictionaries, where each dictionary contains the 'title' and 'link' of a post.
+        dict: a 'repos' field with a list of dictionaries, where each dictionary
+        contains the 'title' and 'link' of a repo. In case of error, it contains
+        'status' and 'error_message' fields instead.
     """
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5'
-        }
-        res = requests.get("https://github.com/trending", headers=headers)
-
-        soup = BeautifulSoup(res.content, "html.parser")
-        repos = []
-
-        # Find all article elements which contain repository info
-        # Updated selector based on the provided HTML structure
-        repo_articles = soup.find_all("article", class_="Box-row")
-
-        for article in repo_articles:
-            # Find the h2 tag containing the link
-            h2_tag = article.find("h2", class_="h3")
-            if not h2_tag:
-                continue  # Skip if structure is unexpected
-
-            link_tag = h2_tag.find("a")
-            if link_tag and link_tag.has_attr("href"):
-                relative_link = link_tag["href"]
-                full_link = f"https://github.com{relative_link}"
-
-                # Extract and clean the title text (owner / repo_name)
-                # Use .stripped_strings to get text parts and join them
-                title_parts = list(link_tag.stripped_strings)
-                if len(title_parts) >= 2:
-                    # Join the parts, assuming the format is like ['owner', '/', 'repo_name']
-                    # or just ['owner / repo_name'] after stripping
-                    title = " ".join(title_parts).replace(
-                        " ", ""
-                    )  # Aims for "owner/repo_name"
-                else:
-                    title = (
-                        link_tag.get_text(strip=True).replace("\n", "").replace(" ", "")
-                    )
-
-                repos.append({"title": title, "link": full_link})
+        repos = _cache_get("github_trending")
+        if repos is None:
+            res = _SESSION.get(
+                "https://github.com/trending", timeout=_REQUEST_TIMEOUT
+            )
+            res.raise_for_status()
+            repos = _parse_github_trending_repos(res.content)
+            _cache_put("github_trending", repos)
 
         if number_of_repos is not None:
             repos = repos[:number_of_repos]
 
-        return {
-            "status": "success",
-            "repos": repos,
-        }
+        return {"repos": repos}
     except Exception as e:
         return {
             "status": "error",
@@ -129,131 +239,205 @@ def get_github_trending_repos(number_of_repos: Optional[int] = None):
         }
 
 
-def get_deped_rss_feed(max_items: Optional[int] = 10) -> Dict:
+# Compiled once at import; each call then runs a single C-level pass per
+# field instead of Python-level find/findtext walks. smart_strings=False
+# skips building the parent-aware string proxies we never use.
+_DC_NS = {"dc": "http://purl.org/dc/elements/1.1/"}
+_TITLE_XPATH = etree.XPath("./title/text()[1]", smart_strings=False)
+_LINK_XPATH = etree.XPath("./link/text()[1]", smart_strings=False)
+_DESCRIPTION_XPATH = etree.XPath("./description/text()[1]", smart_strings=False)
+_PUB_DATE_XPATH = etree.XPath("./pubDate/text()[1]", smart_strings=False)
+_CATEGORY_XPATH = etree.XPath("./category/text()", smart_strings=False)
+_CREATOR_XPATH = etree.XPath(
+    "./dc:creator/text()[1]", namespaces=_DC_NS, smart_strings=False
+)
+
+# Channel metadata fields copied into feed_info, keyed by their RSS tag name
+_CHANNEL_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "description",
+    "lastBuildDate": "last_build_date",
+}
+
+
+@lru_cache(maxsize=128)
+def _format_pub_date(pub_date: str) -> str:
+    """Formats an RFC 822 pubDate into a readable form, caching repeats.
+
+    parsedate_to_datetime is built for exactly the date format RSS uses
+    and is locale-independent, unlike a strptime with %a/%b directives.
+    """
+    try:
+        dt = parsedate_to_datetime(pub_date)
+        return dt.strftime("%B %d, %Y at %I:%M %p")
+    except (TypeError, ValueError):
+        return pub_date
+
+
+# Cap on the plain-text description sent back to the LLM; every extra
+# character costs prompt tokens downstream
+_DESCRIPTION_MAX_CHARS = 500
+
+
+def _parse_deped_item(item) -> Dict:
+    """Extracts one RSS <item> element into the tool's item dict."""
+    # Parse publication date to a nicer format
+    pub_date = (_PUB_DATE_XPATH(item) or [""])[0]
+    formatted_date = _format_pub_date(pub_date)
+
+    # WordPress descriptions arrive as HTML; strip the tags and cap length
+    description = (_DESCRIPTION_XPATH(item) or [""])[0]
+    if description:
+        description = HTMLParser(description).text(separator=" ", strip=True)
+        description = description[:_DESCRIPTION_MAX_CHARS]
+
+    return {
+        "title": (_TITLE_XPATH(item) or [""])[0],
+        "link": (_LINK_XPATH(item) or [""])[0],
+        "description": description,
+        "formatted_date": formatted_date,
+        "categories": _CATEGORY_XPATH(item),
+        "creator": (_CREATOR_XPATH(item) or [""])[0],
+    }
+
+
+def _deped_request_headers() -> Dict:
+    """Builds DepEd request headers, revalidating with the last seen ETag."""
+    if _deped_etag:
+        return {**_DEPED_HEADERS, "If-None-Match": _deped_etag}
+    return _DEPED_HEADERS
+
+
+def _deped_body_from_response(response) -> Optional[bytes]:
+    """Returns the feed body for a DepEd response, or None on failure.
+
+    A 304 Not Modified reuses the body cached from the previous fetch;
+    a 200 refreshes the cached body and ETag.
+    """
+    global _deped_etag, _deped_content
+
+    if response.status_code == 304 and _deped_content is not None:
+        return _deped_content
+    if response.status_code != 200:
+        return None
+
+    _deped_etag = response.headers.get("ETag")
+    _deped_content = response.content
+    return _deped_content
+
+
+def _parse_deped_feed(content: bytes, max_items: Optional[int]) -> Dict:
+    """Parses the DepEd RSS feed XML into the tool's result dict.
+
+    Streams the document with iterparse and stops after max_items <item>
+    elements, so a long feed never gets fully built in memory when the
+    caller only wants the first few entries.
+    """
+    feed_info = {name: "" for name in _CHANNEL_FIELDS.values()}
+    items = []
+    found_channel = False
+
+    try:
+        # recover=True lets lxml salvage mildly malformed feeds
+        for _, elem in etree.iterparse(
+            io.BytesIO(content), events=("end",), recover=True, huge_tree=False
+        ):
+            parent = elem.getparent()
+
+            if elem.tag == "item":
+                # Check before appending so non-positive caps return no items
+                if max_items is not None and len(items) >= max_items:
+                    break
+
+                items.append(_parse_deped_item(elem))
+
+                # Free the item and any already-processed earlier siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+            elif parent is not None and parent.tag == "channel":
+                # Channel metadata ends before the first item in WordPress feeds
+                found_channel = True
+                if elem.tag in _CHANNEL_FIELDS:
+                    feed_info[_CHANNEL_FIELDS[elem.tag]] = elem.text or ""
+            elif elem.tag == "channel":
+                found_channel = True
+    except etree.XMLSyntaxError as e:
+        return {
+            "status": "error",
+            "error_message": f"Failed to parse RSS feed XML: {str(e)}"
+        }
+
+    if not found_channel:
+        return {
+            "status": "error",
+            "error_message": "Invalid RSS feed format (no channel element found)"
+        }
+
+    return {
+        "status": "success",
+        "feed_info": feed_info,
+        "items": items
+    }
+
+
+def _filter_item_fields(result: Dict, fields: Optional[List[str]]) -> Dict:
+    """Keeps only the requested per-item fields in a successful feed result."""
+    if not fields or result.get("status") != "success":
+        return result
+
+    wanted = set(fields)
+    return {
+        **result,
+        "items": [
+            {key: value for key, value in item.items() if key in wanted}
+            for item in result["items"]
+        ],
+    }
+
+
+def get_deped_rss_feed(
+    max_items: Optional[int] = 10, fields: Optional[List[str]] = None
+) -> Dict:
     """
     Fetches and parses the DepEd RSS feed.
 
     Args:
         max_items: Maximum number of items to return. Default is 10.
+        fields: Optional list of per-item fields to keep (e.g. ['title', 'link']).
+            If None, each item includes title, link, description, formatted_date,
+            categories, and creator.
 
     Returns:
         dict: status and results. In case of success, it contains a 'feed_info' field with
         channel information and a 'items' field with a list of news items.
     """
     try:
-        # Set request headers to mimic a browser request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://www.deped.gov.ph/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-        }
-        
-        # Fetch the RSS feed with headers and allow redirects
-        response = requests.get(
-            "https://www.deped.gov.ph/feed/", 
-            headers=headers, 
+        cache_key = ("deped", max_items)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return _filter_item_fields(cached, fields)
+
+        # Fetch the RSS feed from the pre-resolved URL
+        response = _SESSION.get(
+            _deped_feed_url(),
+            headers=_deped_request_headers(),
             allow_redirects=True,
-            timeout=10
+            timeout=_REQUEST_TIMEOUT
         )
-        
-        if response.status_code != 200:
-            # Try alternate URL
-            alternate_url = "https://www.deped.gov.ph/feed"
-            response = requests.get(
-                alternate_url,
-                headers=headers,
-                allow_redirects=True,
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                return {
-                    "status": "error",
-                    "error_message": f"Failed to fetch RSS feed. Status code: {response.status_code}"
-                }
-        
-        # Parse the XML
-        try:
-            root = ET.fromstring(response.content)
-        except ET.ParseError:
-            # Try to clean the XML content if parsing fails
-            cleaned_content = response.content.decode('utf-8', errors='ignore')
-            cleaned_content = cleaned_content.encode('utf-8')
-            try:
-                root = ET.fromstring(cleaned_content)
-            except ET.ParseError as e:
-                return {
-                    "status": "error",
-                    "error_message": f"Failed to parse RSS feed XML: {str(e)}"
-                }
-        
-        # Get channel information
-        channel = root.find("channel")
-        if channel is None:
+
+        content = _deped_body_from_response(response)
+        if content is None:
             return {
                 "status": "error",
-                "error_message": "Invalid RSS feed format (no channel element found)"
+                "error_message": f"Failed to fetch RSS feed. Status code: {response.status_code}"
             }
-            
-        feed_info = {
-            "title": channel.find("title").text if channel.find("title") is not None else "",
-            "link": channel.find("link").text if channel.find("link") is not None else "",
-            "description": channel.find("description").text if channel.find("description") is not None else "",
-            "last_build_date": channel.find("lastBuildDate").text if channel.find("lastBuildDate") is not None else "",
-        }
-        
-        # Get items
-        items = []
-        for item in channel.findall("item")[:max_items]:
-            # Parse publication date
-            pub_date = item.find("pubDate").text if item.find("pubDate") is not None else ""
-            
-            # Try to parse date to a nicer format
-            try:
-                dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %z")
-                formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
-            except Exception:
-                formatted_date = pub_date
-            
-            # Extract description and clean it up
-            description = item.find("description").text if item.find("description") is not None else ""
-            
-            # Get categories
-            categories = []
-            for category in item.findall("category"):
-                if category.text:
-                    categories.append(category.text)
-            
-            # Handle namespaces properly for creator
-            creator = ""
-            creator_elem = item.find(".//{http://purl.org/dc/elements/1.1/}creator")
-            if creator_elem is not None and creator_elem.text:
-                creator = creator_elem.text
-                
-            items.append({
-                "title": item.find("title").text if item.find("title") is not None else "",
-                "link": item.find("link").text if item.find("link") is not None else "",
-                "description": description,
-                "pub_date": pub_date,
-                "formatted_date": formatted_date,
-                "categories": categories,
-                "creator": creator
-            })
-        
-        return {
-            "status": "success",
-            "feed_info": feed_info,
-            "items": items
-        }
+
+        result = _parse_deped_feed(content, max_items)
+        if result["status"] == "success":
+            _cache_put(cache_key, result)
+        return _filter_item_fields(result, fields)
     except Exception as e:
         return {
             "status": "error",
@@ -261,6 +445,101 @@ def get_deped_rss_feed(max_items: Optional[int] = 10) -> Dict:
         }
 
 
+async def _fetch_hackernews(number_of_posts: Optional[int] = None) -> Dict:
+    """Async variant of get_hackernews_posts using the shared httpx client."""
+    posts = _cache_get("hackernews")
+    if posts is None:
+        res = await _ASYNC_CLIENT.get("https://news.ycombinator.com/")
+        res.raise_for_status()
+        posts = _parse_hackernews_posts(res.content)
+        _cache_put("hackernews", posts)
+
+    if number_of_posts is not None:
+        posts = posts[:number_of_posts]
+
+    return {"posts": posts}
+
+
+async def _fetch_github_trending(number_of_repos: Optional[int] = None) -> Dict:
+    """Async variant of get_github_trending_repos using the shared httpx client."""
+    repos = _cache_get("github_trending")
+    if repos is None:
+        res = await _ASYNC_CLIENT.get("https://github.com/trending")
+        res.raise_for_status()
+        repos = _parse_github_trending_repos(res.content)
+        _cache_put("github_trending", repos)
+
+    if number_of_repos is not None:
+        repos = repos[:number_of_repos]
+
+    return {"repos": repos}
+
+
+async def _fetch_deped(max_items: Optional[int] = 10) -> Dict:
+    """Async variant of get_deped_rss_feed using the shared httpx client."""
+    cache_key = ("deped", max_items)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Reuse the resolved URL when the sync path has already found it; the
+    # client follows redirects itself, so the default URL also works
+    response = await _ASYNC_CLIENT.get(
+        _deped_resolved_url or _DEPED_FEED_URL, headers=_deped_request_headers()
+    )
+
+    content = _deped_body_from_response(response)
+    if content is None:
+        return {
+            "status": "error",
+            "error_message": f"Failed to fetch RSS feed. Status code: {response.status_code}"
+        }
+
+    result = _parse_deped_feed(content, max_items)
+    if result["status"] == "success":
+        _cache_put(cache_key, result)
+    return result
+
+
+async def get_all_sources(
+    number_of_posts: Optional[int] = None, max_items: Optional[int] = 10
+) -> Dict:
+    """
+    Fetches Hacker News posts, GitHub trending repos, and the DepEd RSS feed concurrently.
+
+    The three sources live on different hosts, so fetching them in parallel takes
+    roughly as long as the slowest single fetch instead of the sum of all three.
+
+    Args:
+        number_of_posts: The number of HN posts and GitHub repos to return. If None, returns all.
+        max_items: Maximum number of DepEd feed items to return. Default is 10.
+
+    Returns:
+        dict: 'hackernews', 'github_trending', and 'deped' fields, each holding the
+        same result dict the corresponding single-source tool would return.
+    """
+    hn, gh, deped = await asyncio.gather(
+        _fetch_hackernews(number_of_posts),
+        _fetch_github_trending(number_of_posts),
+        _fetch_deped(max_items),
+        return_exceptions=True,
+    )
+
+    def _result_or_error(result, source):
+        if isinstance(result, BaseException):
+            return {
+                "status": "error",
+                "error_message": f"Error when trying to fetch {source}: {result}",
+            }
+        return result
+
+    return {
+        "hackernews": _result_or_error(hn, "hackernews posts"),
+        "github_trending": _result_or_error(gh, "trending repos"),
+        "deped": _result_or_error(deped, "the DepEd RSS feed"),
+    }
+
+
 # Define the search agent with only google_search tool
 search_agent = Agent(
     name="search_assistant",
@@ -318,13 +597,16 @@ root_agent = Agent(
     - Use the hackernews_agent for questions about current tech news and GitHub trends
     - Use the search_assistant for general questions requiring web search
     - Use the deped_agent for questions about Department of Education news, updates, and official communications
-    
+    - Use the get_all_sources tool when the user wants an overview spanning tech news and DepEd news,
+      since it fetches all three sources in parallel with a single call
+
     If one agent encounters an error, try to use another relevant agent to still provide helpful information.
     For example, if the deped_agent cannot connect to the RSS feed, use the search_assistant to find recent DepEd news.
     """,
     tools=[
         agent_tool.AgentTool(agent=search_agent),
         agent_tool.AgentTool(agent=hackernews_agent),
-        agent_tool.AgentTool(agent=deped_agent)
+        agent_tool.AgentTool(agent=deped_agent),
+        get_all_sources
     ]
 )
\ No newline at end of file